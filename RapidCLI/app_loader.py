@@ -1,10 +1,14 @@
+import functools
+import hashlib
 import importlib
+import importlib.util
 import inspect
-import json
 import os
+import pickle
 import traceback
-from typing import Any, Dict
+from typing import Any, Dict, List, Tuple, Union
 
+import rapidcli.config_registrar
 import rapidcli.settings as settings
 from rapidcli.config_registrar import (
     CLIConfig,
@@ -13,6 +17,7 @@ from rapidcli.config_registrar import (
 )
 from rapidcli.utils import (
     CLIColors,
+    get_cache_path,
     get_cli_parent_path,
     is_plural,
     load_yaml,
@@ -20,60 +25,110 @@ from rapidcli.utils import (
     render_string,
     write_content,
 )
-from rapidcli.rapid_admin import (
-    rapid_admin,
-)  # lets just import the admin CLI for now.  We can update it later.
+
+# Parsed yml files keyed by absolute path, the value is (st_mtime_ns, parsed data).
+_yaml_cache: Dict[str, Tuple[int, Any]] = {}
+
+
+def __getattr__(name: str):
+    """Import the admin CLI on first access instead of on every CLI startup."""
+    if name == "rapid_admin":
+        from rapidcli.rapid_admin import rapid_admin
+
+        return rapid_admin
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def load_framework_cli(cli: type):
-    cli_config_data = retrieve_cli_config_data(cli)
+    load_framework_cli_from_data(cli, retrieve_cli_config_data(cli))
+
+
+def load_framework_cli_from_data(cli: type, cli_config_data: Dict):
     admin_cli_path = get_cli_parent_path(cli)
     admin_project_path = ["rapidcli"] + [
         path for path in admin_cli_path.split("rapidcli")[1].split(os.sep) if path
     ]
     for app in cli_config_data["apps"]:
         app_path = os.path.join(admin_cli_path, app)
-        modules = get_app_modules(app_path)
-        for module in modules:
-            pyless_module = module.split(".")[0]
+        for pyless_module in _get_loadable_modules(get_app_modules(app_path)):
             importlib.import_module(".".join(admin_project_path + [app, pyless_module]))
 
 
 def load_cli_settings(cli: type):
     """Loads the settings for the given CLI."""
+    load_cli_settings_from_data(cli, retrieve_cli_config_data(cli))
+
+
+def load_cli_settings_from_data(cli: type, cli_config_data: Dict):
+    """Loads the settings for the given CLI from its already parsed cli_config.yml data."""
     mod = inspect.getmodule(cli)
-    mod.settings = retrieve_cli_config_data(cli)
+    mod.settings = cli_config_data
     settings.settings.update(mod.settings)
 
 
 def load_apps_in_cli(cli: type):
     """Load the apps for a given CLI."""
+    load_apps_in_cli_from_data(cli, retrieve_cli_config_data(cli))
+
+
+def load_apps_in_cli_from_data(cli: type, cli_config_data: Dict):
+    """Load the apps for a given CLI from its already parsed cli_config.yml data."""
+    # lets just import the admin CLI for now.  We can update it later.
+    from rapidcli.rapid_admin import rapid_admin
+
     if cli == rapid_admin.RapidAdmin:
-        load_framework_cli(cli)
+        load_framework_cli_from_data(cli, cli_config_data)
         return
 
-    cli_config_data = retrieve_cli_config_data(cli)
     _load_apps(cli_config_data, get_cli_parent_path(cli))
 
 
 def load_apps_from_file(cli_config_path: str, apps_directory: str):
-    cli_config_data = load_yaml(cli_config_path)
+    cli_config_data = load_cached_yaml(cli_config_path)
     _load_apps(cli_config_data, apps_directory)
 
 
-def _load_modules(app, app_py_files):
-    for app_py_file in app_py_files:
-        try:
-            importlib.import_module(f"{app}.{app_py_file.split('.')[0]}")
-        except ModuleNotFoundError:
-            # If in the same directory as the app when executing just import the file
-            importlib.import_module(app_py_file.split(".")[0])
+def _get_loadable_modules(app_py_files):
+    """Retrieve the module names of the app's python files, private modules and __init__ are skipped."""
+    return [
+        app_py_file.split(".")[0]
+        for app_py_file in app_py_files
+        if not app_py_file.startswith("_")
+    ]
+
+
+def _resolve_module_name(app: str, pyless_module: str) -> str:
+    """Retrieve the importable name of an app module without raising ImportErrors."""
+    app_module = f"{app}.{pyless_module}"
+    app_spec = importlib.util.find_spec(app)
+    # Only packages can be searched for submodules
+    if (
+        app_spec
+        and app_spec.submodule_search_locations is not None
+        and importlib.util.find_spec(app_module)
+    ):
+        return app_module
+    # If in the same directory as the app when executing just import the file
+    return pyless_module
+
+
+def _import_modules(module_names: List[str]):
+    """Import the modules one after another, extensions register in the order they're imported."""
+    for module_name in module_names:
+        importlib.import_module(module_name)
 
 
 def _load_apps(cli_config_data: Dict, apps_dir: str):
-    for app in cli_config_data["apps"]:
-        app_path = os.path.join(apps_dir, app)
-        _load_modules(app, get_app_modules(app_path))
+    # Apps load in their cli_config.yml order, which decides whose extension wins a shared name.
+    # Each app's modules are sorted, scandir order differs between filesystems.
+    module_names = [
+        _resolve_module_name(app, pyless_module)
+        for app in cli_config_data["apps"]
+        for pyless_module in sorted(
+            _get_loadable_modules(get_app_modules(os.path.join(apps_dir, app)))
+        )
+    ]
+    _import_modules(module_names)
 
 
 def compile_app_configs_into_cli_config_from_data(cli_data: Dict, apps_dir: str):
@@ -85,9 +140,10 @@ def _compile_configs(apps_dir: str, app_list):
     compiled_config_data = {}
     for app in app_list:
         config_path = os.path.join(apps_dir, app, "app_config.yml")
-        if not os.path.exists(config_path):
+        try:
+            data = load_cached_yaml(config_path)
+        except FileNotFoundError:
             continue
-        data = load_yaml(config_path)
         if data:
             compiled_config_data.update(data)
 
@@ -95,11 +151,99 @@ def _compile_configs(apps_dir: str, app_list):
 
 
 def create_cli_config_from_cli(cli: type):
-    load_cli_settings(cli)
-    load_apps_in_cli(cli)
+    # Parse the cli_config.yml once and hand the data to every loading step
     cli_data = retrieve_cli_config_data(cli)
-    # Always just recreate the tool config to enable allow for config updates
-    return create_cli_config_from_cli_from_data(cli_data, get_cli_parent_path(cli))
+    load_cli_settings_from_data(cli, cli_data)
+    load_apps_in_cli_from_data(cli, cli_data)
+    apps_dir = get_cli_parent_path(cli)
+    # The tool config is recreated whenever a config, or the code defining them, is updated
+    fingerprint = get_cli_config_fingerprint(cli_data, apps_dir)
+    cache_path = get_cli_config_cache_path(apps_dir)
+    cli_config = _load_pickled_cli_config(cache_path, fingerprint)
+    if cli_config is None:
+        cli_config = create_cli_config_from_cli_from_data(cli_data, apps_dir)
+        _pickle_cli_config(cli_config, cache_path, fingerprint)
+    return cli_config
+
+
+def get_cli_config_fingerprint(cli_data: Dict, apps_dir: str) -> str:
+    """Fingerprint the current state of the CLI's configs.
+
+    The fingerprint covers the modification times of cli_config.yml, every app_config.yml and
+    the python modules of the apps and config registrar, so any change to them changes it.
+    """
+    fingerprint_paths = [
+        os.path.join(apps_dir, "cli_config.yml"),
+        rapidcli.config_registrar.__file__,
+    ]
+    for app in cli_data["apps"]:
+        app_path = os.path.join(apps_dir, app)
+        fingerprint_paths.append(os.path.join(app_path, "app_config.yml"))
+        fingerprint_paths.extend(
+            os.path.join(app_path, module) for module in get_app_modules(app_path)
+        )
+
+    fingerprint = hashlib.blake2b(digest_size=16)
+    for path in fingerprint_paths:
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            mtime = None
+        fingerprint.update(f"{os.path.abspath(path)}:{mtime}\n".encode())
+    return fingerprint.hexdigest()
+
+
+def get_cli_config_cache_path(apps_dir: str) -> Union[str, None]:
+    """Retrieve the path of the CLI's pickled CLIConfig, None if the cache directory is unusable.
+
+    There is one file per CLI, named after its directory, which is overwritten whenever its
+    configs change.
+    """
+    cli_key = hashlib.blake2b(
+        os.path.abspath(apps_dir).encode(), digest_size=16
+    ).hexdigest()
+    try:
+        return get_cache_path("cli_configs", f"{cli_key}.pkl")
+    except OSError:
+        return None
+
+
+def _load_pickled_cli_config(cache_path: Union[str, None], fingerprint: str):
+    """Load the pickled CLIConfig if it was saved for the same fingerprint, else None."""
+    if cache_path is None:
+        return None
+    try:
+        with open(cache_path, "rb") as cache_file:
+            cached_fingerprint, cli_config = pickle.load(cache_file)
+    except Exception:
+        # A missing, unreadable or outdated pickle is just rebuilt.
+        return None
+    if cached_fingerprint != fingerprint:
+        return None
+    return cli_config
+
+
+def _pickle_cli_config(
+    cli_config: CLIConfig, cache_path: Union[str, None], fingerprint: str
+):
+    """Save the CLIConfig to be reused until the configs change, caching is best effort."""
+    if cache_path is None:
+        return
+    # Written next to the cache file and swapped in, so a failed dump never leaves a partial pickle.
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as cache_file:
+            pickle.dump(
+                (fingerprint, cli_config),
+                cache_file,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        os.replace(tmp_path, cache_path)
+    except Exception:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
 
 
 def create_cli_config_from_cli_from_data(cli_config_yaml_data: Dict, apps_dir: str):
@@ -113,12 +257,26 @@ def create_cli_config_from_cli_from_data(cli_config_yaml_data: Dict, apps_dir: s
 
 
 def get_app_config(app_dir: str):
-    return [file for file in os.listdir(app_dir) if file == "app_config.yml"]
+    """Retrieve the name of the app's app_config.yml or None if the app has none."""
+    with os.scandir(app_dir) as entries:
+        return next(
+            (
+                entry.name
+                for entry in entries
+                if entry.name == "app_config.yml" and entry.is_file()
+            ),
+            None,
+        )
 
 
 def get_app_modules(app_dir: str):
     try:
-        return [file for file in os.listdir(app_dir) if file.endswith(".py")]
+        with os.scandir(app_dir) as entries:
+            return [
+                entry.name
+                for entry in entries
+                if entry.name.endswith(".py") and entry.is_file()
+            ]
     except FileNotFoundError:
         traceback.print_exc()
         app_value = CLIColors.build_value_string(os.path.basename(app_dir))
@@ -128,39 +286,27 @@ def get_app_modules(app_dir: str):
 
 # TODO(bgarrard): redefine/replace the whole model instantiation process
 def instantiate_configs_in_dict(config_dict: Dict, config_to_set: Config = None):
-    def recursively_set_attrs(instance, attr: str, vals: Any):
-        """Create basic configs and expose attributes for use.  Create a linked list of Config objects."""
-        if isinstance(vals, dict):
-            config_name = f"{attr}{Config.CONFIG_SUFFIX}"
-            new_config = (
-                config_registry[config_name]()
-                if config_name in config_registry
-                else Config()
-            )
-
-            for att, val in vals.items():
-                recursively_set_attrs(new_config, att, val)
-
-            instance.add_var(attr, new_config)
-        elif isinstance(vals, list):
-            new_configs = []
-            # If the naming of the attribute is plural, we assume that the name
-            # of the objects in the list are the singular versions.
-            # We only want to create python objects with key/value pair types.
-            # So checking the first element if it can be an object is necessary
-            if is_plural(attr) and hasattr(vals[0], "items"):
-                config_name = f"{make_singular(attr)}{Config.CONFIG_SUFFIX}"
-                config_definition = config_registry.get(config_name)
-                for item in vals:
-                    new_config = config_definition() if config_definition else Config()
-                    if hasattr(item, "items"):
-                        for n_attr, n_value in item.items():
-                            recursively_set_attrs(new_config, n_attr, n_value)
-                    new_configs.append(new_config)
-
-            instance.add_var(attr, new_configs or vals)
-        else:
-            instance.add_var(attr, vals)
+    """Create basic configs and expose attributes for use.  Create a linked list of Config objects."""
+    get_config_definition = config_registry.get
+    suffix = Config.CONFIG_SUFFIX
+
+    # Work list of (instance, attr, vals) still to be set.  Children are pushed in reverse
+    # so they are popped, and set on their config, in the order they appear in the yml.
+    stack = []
+
+    def push_attrs(instance: Config, vals: Dict):
+        stack.extend((instance, att, val) for att, val in reversed(vals.items()))
+
+    def build_list_configs(attr: str, vals: List) -> List[Config]:
+        """Create the singular config of the attr for every item, their attributes are queued."""
+        config_definition = get_config_definition(make_singular(attr) + suffix)
+        new_configs = []
+        for item in vals:
+            new_config = config_definition() if config_definition else Config()
+            if hasattr(item, "items"):
+                push_attrs(new_config, item)
+            new_configs.append(new_config)
+        return new_configs
 
     if not config_to_set:
         config_to_set = Config()
@@ -169,34 +315,41 @@ def instantiate_configs_in_dict(config_dict: Dict, config_to_set: Config = None)
     # the object should match the field of the cli_config.yml
     for ext_name, ext_values in config_dict.items():
         # Configs have the suffix in their class definition, but I want the name of the extension more easily accessible.
-        config_name = f"{ext_name}{Config.CONFIG_SUFFIX}"
         # specific tool configs are only one level below the root tool config
-        config_instance = (
-            config_registry[config_name]()
-            if config_name in config_registry
-            else Config()
-        )
+        config_definition = get_config_definition(ext_name + suffix)
+        config_instance = config_definition() if config_definition else Config()
         val_to_set = config_instance
         if ext_values is not None:
             if isinstance(ext_values, dict):
-                for ext_attr, ext_params in ext_values.items():
-                    recursively_set_attrs(config_instance, ext_attr, ext_params)
+                push_attrs(config_instance, ext_values)
             elif isinstance(ext_values, list):
-                new_configs = []
-                for item in ext_values:
-                    config_name = f"{make_singular(ext_name)}{Config.CONFIG_SUFFIX}"
-                    config_definition = config_registry.get(config_name)
-                    new_config = config_definition() if config_definition else Config()
-                    if hasattr(item, "items"):
-                        for n_attr, n_value in item.items():
-                            recursively_set_attrs(new_config, n_attr, n_value)
-                    new_configs.append(new_config)
-                    val_to_set = new_configs
+                val_to_set = build_list_configs(ext_name, ext_values) or config_instance
         config_to_set.add_var(ext_name, val_to_set)
 
+    while stack:
+        instance, attr, vals = stack.pop()
+        if isinstance(vals, dict):
+            config_definition = get_config_definition(attr + suffix)
+            new_config = config_definition() if config_definition else Config()
+            instance.add_var(attr, new_config)
+            push_attrs(new_config, vals)
+        elif isinstance(vals, list):
+            new_configs = []
+            # If the naming of the attribute is plural, we assume that the name
+            # of the objects in the list are the singular versions.
+            # We only want to create python objects with key/value pair types.
+            # So checking the first element if it can be an object is necessary
+            if vals and is_plural(attr) and hasattr(vals[0], "items"):
+                new_configs = build_list_configs(attr, vals)
+
+            instance.add_var(attr, new_configs or vals)
+        else:
+            instance.add_var(attr, vals)
+
     return config_to_set
 
 
+@functools.lru_cache(maxsize=None)
 def get_cli_config_path(cli: type):
     """Retrieve the cli_config.yml path near the cse_cli.py."""
     cli_config_path = os.path.join(get_cli_parent_path(cli), "cli_config.yml")
@@ -208,22 +361,71 @@ def get_cli_config_path(cli: type):
 
 
 def retrieve_cli_config_data(cli: type):
-    return load_yaml(get_cli_config_path(cli))
+    return load_cached_yaml(get_cli_config_path(cli))
+
+
+def load_cached_yaml(yaml_path: str):
+    """Load a yml file, reusing the previous parse if the file has not been modified since."""
+    yaml_path = os.path.abspath(yaml_path)
+    mtime = os.stat(yaml_path).st_mtime_ns
+    cached = _yaml_cache.get(yaml_path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    data = load_yaml(yaml_path)
+    _yaml_cache[yaml_path] = (mtime, data)
+    return data
 
 
 def render_config_args(config_obj: Config):
+    """Render {{}} in the config's values, in place, using the key/values found in the config itself.
+
+    Every string renders against the config as it was loaded.  Lists and dicts holding templates
+    are rebuilt rather than changed, they can be shared with the cached yaml data.
+    """
     render_args = convert_to_dict(config_obj)
-    new_dict = json.loads(render_string(json.dumps(render_args), render_args))
-    rendered_config = instantiate_configs_in_dict(new_dict, Config())
-    for already_set_field, already_set_value in config_obj.items():
-        # TODO(bgarrard): This is absolutely terrible.  Need to find a better way to not overwrite already set fields
-        if (
-            isinstance(already_set_value, str)
-            and not isinstance(already_set_value, Config)
-            and not isinstance(already_set_value, list)
-        ):
-            rendered_config.set_var(already_set_field, already_set_value)
-    return rendered_config
+    rendered_configs = set()
+    for field, value in list(config_obj.items()):
+        # Fields already set as strings at the top of the config, e.g. user input, are left as they are.
+        if field.startswith("_") or isinstance(value, str):
+            continue
+        rendered_value = _render_leaves(value, render_args, rendered_configs)
+        if rendered_value is not value:
+            config_obj.set_var(field, rendered_value)
+    return config_obj
+
+
+def _render_leaves(value: Any, render_args: Dict, rendered_configs: set) -> Any:
+    """Render every templated string found while walking the value, unchanged values are returned as is.
+
+    Nested configs are rendered in place, once each, and tracked by id in rendered_configs.
+    """
+    if isinstance(value, str):
+        return render_string(value, render_args) if "{" in value else value
+    if isinstance(value, list):
+        rendered_items = [
+            _render_leaves(item, render_args, rendered_configs) for item in value
+        ]
+        if any(new is not old for new, old in zip(rendered_items, value)):
+            return rendered_items
+        return value
+    if isinstance(value, dict):
+        rendered_items = {
+            key: _render_leaves(val, render_args, rendered_configs)
+            for key, val in value.items()
+        }
+        if any(rendered_items[key] is not val for key, val in value.items()):
+            return rendered_items
+        return value
+    if isinstance(value, Config) and id(value) not in rendered_configs:
+        rendered_configs.add(id(value))
+        for field, field_value in list(value.items()):
+            if field.startswith("_"):
+                continue
+            rendered_value = _render_leaves(field_value, render_args, rendered_configs)
+            if rendered_value is not field_value:
+                value.set_var(field, rendered_value)
+    return value
 
 
 def convert_to_dict(obj: Any) -> Dict:
@@ -234,11 +436,14 @@ def convert_to_dict(obj: Any) -> Dict:
     for key, val in obj.__dict__.items():
         if key.startswith("_"):
             continue
-        element = []
+        # Only recurse in to objects, primitive leaves are copied over as is.
         if isinstance(val, list):
-            for item in val:
-                element.append(convert_to_dict(item))
+            result[key] = [
+                convert_to_dict(item) if hasattr(item, "__dict__") else item
+                for item in val
+            ]
+        elif hasattr(val, "__dict__"):
+            result[key] = convert_to_dict(val)
         else:
-            element = convert_to_dict(val)
-        result[key] = element
+            result[key] = val
     return result
@@ -11,7 +11,7 @@ from rapidcli.app_loader import (
 from rapidcli.extension_registrar import (
     get_class_registrations,
     get_function_registrations,
-    get_registrations,
+    get_sorted_registrations,
 )
 from rapidcli.utils import CLIColors
 
@@ -117,10 +117,11 @@ class CLI:
 
     def _get_flag_from_user_input(self) -> str:
         """Retrieve the flag to activate an extension."""
-        try:
-            return next(k for k, v in vars(self.args).items() if v != None)
-        except StopIteration:
+        # Extension flags default to argparse.SUPPRESS, only the flags given by the user are present
+        ext_name = next(iter(vars(self.args)), None)
+        if ext_name is None:
             self.root_parser.error("No arguments found")
+        return ext_name
 
     def _run_extension(self, extension_name, *args):
         """Runs the extension from the cli object dynamically."""
@@ -131,33 +132,26 @@ class CLI:
 
     def _define_extension_flags(self):
         """Create the flags for function based extensions to be exposed to the user in the interface."""
-        for registration in sorted(get_registrations(), key=lambda x: x.name):
+        for registration in get_sorted_registrations():
             self.root_parser.add_argument(
                 f"--{registration.name}",
                 nargs="*",
+                default=argparse.SUPPRESS,
                 help=f"{registration.colored_registration_doc}\n",
             )
 
     def _extend_cli(self, *args, **kwargs):
         """Extend the cli object by injecting all of the extensions in to it."""
+        kwargs_items = tuple(kwargs.items())
+        get_extension_config = self.cli_config.get_extension_config
         for registration in get_class_registrations():
             cls_ext_obj = registration.extension
-            _ = [
+            for attr, attr_value in kwargs_items:
                 setattr(cls_ext_obj, attr, attr_value)
-                for attr, attr_value in kwargs.items()
-            ]
-            setattr(cls_ext_obj, "cli_config", self.cli_config)
-            setattr(
-                self,
-                registration.name,
-                cls_ext_obj,
-            )
-
-            setattr(
-                cls_ext_obj,
-                "config",
-                self.cli_config.get_extension_config(cls_ext_obj.get_name()),
-            )
+            cls_ext_obj.cli_config = self.cli_config
+            setattr(self, registration.name, cls_ext_obj)
+            # The registration name is the extension's name computed when it was registered
+            cls_ext_obj.config = get_extension_config(registration.name)
 
         for registration in get_function_registrations():
             setattr(self, registration.name, registration.extension)
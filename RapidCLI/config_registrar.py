@@ -22,19 +22,20 @@ but a config can not live without a class based extension besides CLIConfig.  Th
 it is for the CLI.
 """
 import functools
+import io
 import sys
 import traceback
 from difflib import get_close_matches
-from typing import Any, Callable, Dict, List, Union
+from typing import Any, Callable, Dict, List, Tuple, Union
 
+import yaml
 from rapidcli.utils import (
     CLIColors,
+    YamlSafeLoader,
     change_to_snake_case,
-    get_erroring_attr,
     get_path_from_repo_root,
     iterate_down_to,
 )
-from yaml import safe_load
 
 CONFIG_MODEL_SUFFIX = "_config"
 
@@ -56,40 +57,52 @@ def register_config(cls=None, root=False):
 
 
 class Config:
-    CONFIG_SUFFIX = "_config"
+    # Configs are populated dynamically from yml and traversed through their __dict__, so
+    # __dict__ is kept as a slot.  Dropping __weakref__ saves a slot per config.
+    # _version is bumped by set_var so consumers can tell whether the config changed since
+    # they last saw it, as a slot it never shows up among the config's variables.
+    __slots__ = ("__dict__", "_version")
 
-    def __getattribute__(self, name) -> Any:
-        closest_match = ""
+    CONFIG_SUFFIX = "_config"
 
-        try:
-            return super().__getattribute__(name)
-        except AttributeError as ae:
-            # chance to handle the attribute differently
-            attr = get_erroring_attr(ae)
-            try:
-                closest_match = next(
-                    match
-                    for match in get_close_matches(attr, vars(self).keys(), cutoff=0)
+    def __getattr__(self, name) -> Any:
+        """Only called when the normal attribute lookup fails, suggests the closest attribute."""
+        not_found_msg = f"'{type(self).__name__}' object has no attribute '{name}'"
+        # Protocol lookups (copy, pickle, etc) and unset slots should fail fast and quietly
+        if (name.startswith("__") and name.endswith("__")) or name in Config.__slots__:
+            raise AttributeError(not_found_msg)
+
+        attrs = tuple(self.__dict__)
+        if not attrs:
+            print(
+                CLIColors.build_error_string(
+                    "Looks like the CLIconfig has no attributes.  Probably improperly loaded."
                 )
-            except StopIteration:
-                print(
-                    CLIColors.build_error_string(
-                        "Looks like the CLIconfig has no attributes.  Probably improperly loaded."
-                    )
-                )
-                raise ae
-
-            if (
-                closest_match
-            ):  # probably will have some threshold based on 'edit distance'
-                ae.args = (
-                    CLIColors.build_error_string(
-                        f"You tried to access {CLIColors.build_value_string(attr)}. Did you mean {CLIColors.build_value_string(closest_match)}?"
-                    ),
+            )
+            raise AttributeError(not_found_msg)
+
+        closest_match = self._get_closest_attr(name, attrs)
+
+        if closest_match:
+            raise AttributeError(
+                CLIColors.build_error_string(
+                    f"You tried to access {CLIColors.build_value_string(name)}. Did you mean {CLIColors.build_value_string(closest_match)}?"
                 )
-                raise
-            # if not, re-raise the exception
-            raise
+            )
+        raise AttributeError(not_found_msg)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _get_closest_attr(name: str, attrs: Tuple[str, ...]) -> Union[str, None]:
+        """Retrieve the attribute sharing the name's prefix, else the closest one by similarity.
+
+        Cached per (missed attribute, config attributes) so the lookup only runs once per typo.
+        """
+        prefix = name[:3]
+        prefix_match = next((attr for attr in attrs if attr.startswith(prefix)), None)
+        if prefix_match:
+            return prefix_match
+        return next(iter(get_close_matches(name, attrs, n=1, cutoff=0.6)), None)
 
     def __getitem__(self, key: Union[List, Any]) -> Any:
         if isinstance(key, List):
@@ -104,10 +117,10 @@ class Config:
         return self.__class__.__name__
 
     def __contains__(self, element) -> bool:
-        return vars(self).get(element) is not None
+        return self.__dict__.get(element) is not None
 
     def __iter__(self):
-        return vars(self).items()
+        return iter(self.__dict__)
 
     @classmethod
     def get_name(cls):
@@ -118,23 +131,28 @@ class Config:
         """Retrieve the input map to be used for the extension menu."""
         return self.input_menu
 
-    def add_var(self, attr_name: str, attr_value: Any):
-        """Set an attribute variable on the config."""
-        setattr(self, attr_name, attr_value)
-        return self
-
     def set_var(self, attr_name: str, attr_value: Any):
         """Set an attribute variable on the config."""
         setattr(self, attr_name, attr_value)
+        self._version = self.get_version() + 1
         return self
 
+    add_var = set_var
+
+    def get_version(self) -> int:
+        """Retrieve the number of variables set on the config through set_var."""
+        try:
+            return self._version
+        except AttributeError:
+            return 0
+
     def get_var(self, attr_name: str):
         """Retrieve the value of the given attribute name."""
         return getattr(self, attr_name)
 
     def items(self):
-        """Return the items iterator of the dictionary version of this config."""
-        return self.__iter__()
+        """Return the items view of the dictionary version of this config."""
+        return self.__dict__.items()
 
     def keys(self):
         return self.__dict__.keys()
@@ -145,18 +163,24 @@ class Config:
 
 @register_config()
 class ConfirmationMenuConfig(Config):
+    __slots__ = ()
+
     def __init__(self):
         self.attrs: List[str] = None
 
 
 @register_config()
 class InputMenuConfig(Config):
+    __slots__ = ()
+
     def __init__(self):
         ...
 
 
 @register_config()
 class SearchConfig(Config):
+    __slots__ = ()
+
     def __init__(self):
         self.value_name: str = None
         self.source_file: str = None
@@ -178,6 +202,8 @@ class SearchConfig(Config):
 
 @register_config(root=True)
 class CLIConfig(Config):
+    __slots__ = ()
+
     def get_extension_config(self, ext_name: str) -> Config:
         """Retreive this extensions config from the corresponding section in cli_config.yml."""
         # This is for when the config name is given fully
@@ -268,13 +294,13 @@ class SearchResolver:
         """Remove anchors in yaml string and read the yaml file data."""
         file_path = get_path_from_repo_root(*file_path.split("/"))
         with open(file_path, "r") as file:
-            text = []
-            for line in file.readlines():
-                if "<<" in line:
-                    continue
-                text.append(line)
-            data = safe_load("\n".join(text))
-            return self.merge_env_aware_dict(data)
+            text = io.StringIO()
+            for line in file:
+                if "<<" not in line:
+                    text.write(line)
+        text.seek(0)
+        data = yaml.load(text, Loader=YamlSafeLoader)
+        return self.merge_env_aware_dict(data)
 
     def merge_env_aware_dict(self, data_dict):
         if "env_aware" not in data_dict:
@@ -1,11 +1,11 @@
+import functools
 import inspect
 import os
 import pathlib
 import sys
+from types import ModuleType
 from typing import Any, Callable, Dict, List, Tuple, Union
 
-from tqdm import tqdm
-
 import rapidcli.utils
 from rapidcli.app_loader import (
     render_config_args,
@@ -14,7 +14,54 @@ from rapidcli.config_registrar import (
     CLIConfig,
     Config,
 )
-from rapidcli.utils import change_to_snake_case, CLIColors, render_template
+from rapidcli.utils import (
+    change_to_snake_case,
+    CLIColors,
+    iterate_file_paths,
+    render_template,
+)
+
+PROGRESS_BAR_MIN_TEMPLATES = 16
+
+# Answers accepted by the confirmation menu, compared case insensitively
+_YES = frozenset(("y", "yes"))
+_NO = frozenset(("n", "no"))
+
+# Resolved grandparent directory of each module defining extensions
+_module_dir_cache: Dict[ModuleType, str] = {}
+
+
+def get_module_parent_directory(handle: Any) -> str:
+    """Retrieve the resolved parent directory of the directory holding the handle's module."""
+    module = inspect.getmodule(handle)
+    module_dir = _module_dir_cache.get(module)
+    if module_dir is None:
+        module_dir = str(pathlib.Path(inspect.getfile(module)).parent.parent.resolve())
+        _module_dir_cache[module] = module_dir
+    return module_dir
+
+
+def get_positional_arg_names(func: Callable) -> List[str]:
+    """Retrieve the names of the positional arguments of the function, like getfullargspec(func).args."""
+    code = func.__code__
+    return list(code.co_varnames[: code.co_argcount])
+
+
+@functools.lru_cache(maxsize=128)
+def _format_menu(
+    choices: Tuple[str, ...], descriptions: Tuple[Tuple[str, str], ...]
+) -> str:
+    """Format the numbered menu of choices once, the same menu is shown again on every reprompt."""
+    choice_descriptions = dict(descriptions)
+    lines = []
+    for idx, choice in enumerate(choices):
+        if choice in choice_descriptions:
+            lines.append(
+                f"{idx+1}. {CLIColors.build_value_string(choice)} {CLIColors.build_info_string(choice_descriptions[choice])}"
+            )
+        else:
+            lines.append(f"{idx+1}. {CLIColors.build_value_string(choice)}")
+    return "\n".join(lines)
 
 
 class Extension:
@@ -23,13 +70,40 @@ class Extension:
         self.handle = handle if handle else self
         self.is_function = inspect.isfunction(handle)
         self.name = self.get_name()
-        self.doc_string = inspect.getdoc(self.handle)
+        self.doc_string = (
+            inspect.getdoc(self.handle) if self.is_function else self._class_doc_string
+        )
         self.args = self.get_extension_args()
         self.config: Config = None
         self.cli_config: CLIConfig = None
         self.debug = False  # this will be used to debug each extension
         self.template_location = self.get_extension_template_directory()
         self.has_menu_header_been_displayed = False
+        # The config and its version as of the last render_config_args call
+        self._rendered_config: Tuple[Config, int] = None
+
+    def __init_subclass__(cls, **kwargs):
+        """Inspect class based extensions once, when they are defined, instead of per instance."""
+        super().__init_subclass__(**kwargs)
+        cls._set_class_metadata()
+
+    @classmethod
+    def _set_class_metadata(cls):
+        """Store the name, docstring, arguments, template location and hooks of the extension class."""
+        cls._class_name = change_to_snake_case(cls.__name__)
+        # Only the class' own docstring, like inspect.getdoc gives for an instance
+        cls._class_doc_string = (
+            inspect.cleandoc(cls.__doc__) if isinstance(cls.__doc__, str) else None
+        )
+        cls._class_args = get_positional_arg_names(cls.main)[1:]
+        cls._class_template_location = os.path.join(
+            get_module_parent_directory(cls),
+            cls._class_name,
+            "templates",
+        )
+        # Which lifecycle hooks the class overrides, used to dispatch run_extension
+        cls._has_start = cls.start is not Extension.start
+        cls._has_main = cls.main is not Extension.main
 
     def __call__(self, *args: Any, **kwargs: Any) -> Any:
         return self.handle(*args, **kwargs)
@@ -39,11 +113,9 @@ class Extension:
 
     def get_name(self):
         """Retrieve the name of the extension in snake_case."""
-        obj_to_inspect = self.handle if self.is_function else self.handle.__class__
-        members = inspect.getmembers(obj_to_inspect)
-        for attr, value in members:
-            if attr == "__name__":
-                return change_to_snake_case(value)
+        if not self.is_function:
+            return self._class_name
+        return change_to_snake_case(self.handle.__name__)
 
     # TODO(bgarrard):  Find a way to have extension entry point with varying arguments
     # that can be visible when creating documentation and not throw W0221 error.
@@ -59,13 +131,11 @@ class Extension:
     def run_extension(self, *args, **kwargs):
         """This runs the extension in its lifecyle hooks to be used. ready() and start()."""
         self.ready()
-        if type(self).start == Extension.start:
-            self.main(*args, **kwargs)
-        elif type(self).main != Extension.main:
+        if self._has_start:
             self.start()
+        # main still runs without a start hook, that is where function extensions are called
+        if self._has_main or not self._has_start:
             self.main(*args, **kwargs)
-        else:
-            self.start()
 
     def run_function(self, *args, **kwargs):
         """If the current extension is function based, just run it."""
@@ -81,7 +151,13 @@ class Extension:
 
         This method can recieve a transformer that will take a str and output one.
         """
-        extension_input_menu = self.config.get_var(input_menu_name).input_menu
+        extension_input_menu = {
+            config_attr: input_menu_value
+            for config_attr, input_menu_value in self.config.get_var(
+                input_menu_name
+            ).input_menu.items()
+            if config_attr != "input_menu"
+        }
 
         # Gather Config Inputs
         if not self.has_menu_header_been_displayed:
@@ -91,8 +167,6 @@ class Extension:
             self.has_menu_header_been_displayed = True
 
         for config_attr, input_menu_value in extension_input_menu.items():
-            if config_attr == "input_menu":
-                continue
             user_input = None
             try:
                 question = input_menu_value["question"]
@@ -126,7 +200,7 @@ class Extension:
                 "Confirm the Following Settings for the following inputs."
             )
         )
-        while result not in ["y", "yes"]:
+        while result not in _YES:
             for config_attr in self.config.confirmation_menu.attrs:
                 ext_config_attr_val = self.config.get_var(config_attr)
                 print(
@@ -136,16 +210,16 @@ class Extension:
                 print(
                     "it seems you made an invalid selection before.  Please type 'y' or 'n'"
                 )
-            result = input("Continue? y/n\n")  # nosec
-            if result in ["n", "no"]:
+            result = input("Continue? y/n\n").lower()  # nosec
+            if result in _NO:
                 print("exiting setup")
                 sys.exit()
 
     def get_extension_args(self):
         """Retrieve the arguments for an function based or class based extension."""
         if self.is_function:
-            return inspect.getfullargspec(self.handle).args
-        return inspect.getfullargspec(self.main).args[1:]
+            return get_positional_arg_names(self.handle)
+        return list(self._class_args)
 
     def get_rendered_extension_templates(
         self, template_directory: str = None, render_args: Union[Dict, Config] = None
@@ -173,18 +247,25 @@ class Extension:
         if not render_args:
             render_args = vars(self.config)
 
-        ext_name = os.path.basename(template_directory)
+        template_paths = list(iterate_file_paths(template_directory))
+        # Most extensions only have a handful of templates, a progress bar is just overhead there
+        if len(template_paths) > PROGRESS_BAR_MIN_TEMPLATES:
+            from tqdm import tqdm
 
-        rendered_file_names_and_text = []
-        for subdir, _, files in os.walk(template_directory):
-            for f in tqdm(files, desc="Rendering Extension Templates via Jinja"):
+            template_paths = tqdm(
+                template_paths, desc="Rendering Extension Templates via Jinja"
+            )
 
-                template_file_path = os.path.join(subdir, f).split(ext_name)[1]
-                rendered_text = render_template(
-                    render_args, template_file_path, template_directory
-                )
+        rendered_file_names_and_text = []
+        prefix_len = len(template_directory)
+        for template_path in template_paths:
+            # The path of the template relative to the template directory
+            template_file_path = template_path[prefix_len:]
+            rendered_text = render_template(
+                render_args, template_file_path, template_directory
+            )
 
-                rendered_file_names_and_text.append((template_file_path, rendered_text))
+            rendered_file_names_and_text.append((template_file_path, rendered_text))
 
         return rendered_file_names_and_text
 
@@ -204,13 +285,8 @@ class Extension:
     def display_choices(
         self, choices: List[str], choice_descriptions: Dict[str, str] = None
     ):
-        for idx, choice in enumerate(choices):
-            if choice_descriptions and choice in choice_descriptions:
-                print(
-                    f"{idx+1}. {CLIColors.build_value_string(choice)} {CLIColors.build_info_string(choice_descriptions[choice])}"
-                )
-            else:
-                print(f"{idx+1}. {CLIColors.build_value_string(choice)}")
+        descriptions = tuple(choice_descriptions.items()) if choice_descriptions else ()
+        print(_format_menu(tuple(choices), descriptions))
 
     def get_user_choice(self, choices: List[str]):
         choice = input(f"Please select your choice [1-{len(choices)}]:")
@@ -232,10 +308,10 @@ class Extension:
 
         Extension template directories are created with the name of extension as the template folder.
         """
+        if not self.is_function:
+            return self._class_template_location
         return os.path.join(
-            pathlib.Path(
-                inspect.getfile(inspect.getmodule(self.handle))
-            ).parent.parent.resolve(),
+            get_module_parent_directory(self.handle),
             self.name,
             "templates",
         )
@@ -251,5 +327,19 @@ class Extension:
         ...
 
     def render_config_args(self):
-        """Calls on the config to render {{}} in jinja using the key/values found in config itself."""
+        """Calls on the config to render {{}} in jinja using the key/values found in config itself.
+
+        The config is only rendered again if it was replaced or changed through set_var since the last call.
+        """
+        if self._rendered_config is not None:
+            rendered_config, rendered_version = self._rendered_config
+            if (
+                rendered_config is self.config
+                and rendered_version == self.config.get_version()
+            ):
+                return
         setattr(self, "config", render_config_args(self.config))
+        self._rendered_config = (self.config, self.config.get_version())
+
+
+Extension._set_class_metadata()
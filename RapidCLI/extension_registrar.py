@@ -10,10 +10,9 @@ to register and create a function.  Remember to expose it in the actual interfac
 import functools
 import inspect
 import os
-import pathlib
-from typing import Any, Callable, Dict, Set, Union
+from typing import Any, Callable, Dict, Tuple, Union, ValuesView
 
-from rapidcli.extension import Extension
+from rapidcli.extension import Extension, get_module_parent_directory
 from rapidcli.utils import (
     CLIColors,
     get_repo_root,
@@ -37,8 +36,6 @@ class Registration:
         self.alias = self.name if zshrc_alias else None
         self.alt_alias = alt_alias
         self.is_cli = is_cli
-        self.registration_doc = self.get_registration_doc()
-        self.colored_registration_doc = self.get_colored_registration_doc()
 
     def __call__(self, *args: Any, **kwargs: Any) -> Any:
         """Make the extension callable with the arguments that it orginally needs."""
@@ -48,6 +45,16 @@ class Registration:
             )
         return self.extension(*args, **kwargs)
 
+    @functools.cached_property
+    def registration_doc(self) -> str:
+        """The docstring of the extension along with its arguments, built on first access."""
+        return self.get_registration_doc()
+
+    @functools.cached_property
+    def colored_registration_doc(self) -> str:
+        """The colored docstring of the extension along with its arguments, built on first access."""
+        return self.get_colored_registration_doc()
+
     def get_aliases(self) -> str:
         """Retrieve all the aliases that are available for the extension."""
         return [alias for alias in [self.alias, self.alt_alias] if alias]
@@ -84,19 +91,22 @@ class Registration:
         doc.append(self.extension.doc_string if self.extension.doc_string else "")
         return "\n".join(doc)
 
-    def _py_to_sh_cli_arguments_string(self):
-        """Convert python argument list to positional argument list for bash."""
+    @functools.cached_property
+    def _sh_args_string(self) -> str:
+        """The bash positional arguments of the extension, built on first access.
+
+        CLI registrations forward every argument so they are sized by the largest extension,
+        which is only known once the apps are loaded.
+        """
         if not self.is_cli:
-            return " ".join(
-                [f"${arg_pos+1}" for arg_pos in range(len(self.extension.args))]
-            )
+            num_args = len(self.extension.args)
         else:
-            return " ".join(
-                [
-                    f"${arg_pos+1}"
-                    for arg_pos in range(get_greatest_num_args_in_registrations() + 1)
-                ]
-            )
+            num_args = get_greatest_num_args_in_registrations() + 1
+        return " ".join(f"${arg_pos+1}" for arg_pos in range(num_args))
+
+    def _py_to_sh_cli_arguments_string(self):
+        """Convert python argument list to positional argument list for bash."""
+        return self._sh_args_string
 
     def _py_to_sh_docstring(self):
         sh_docstring_list = []
@@ -168,8 +178,22 @@ def register_extension(
 
     @functools.wraps(ext)
     def wrapper(ext):
+        global _registry_version
         registration = Registration(ext, zshrc_alias, alt_alias, is_cli)
         extension_registry[registration.name] = registration
+        _registry_version += 1
+        # Re-registering a name replaces the old registration in whichever bucket held it
+        for bucket in _registry_buckets:
+            bucket.pop(registration.name, None)
+        if registration.alias:
+            _alias_registrations[registration.name] = registration
+        if registration.is_function:
+            _function_registrations[registration.name] = registration
+        else:
+            _class_registrations[registration.name] = registration
+        _max_args_cache["val"] = max(
+            _max_args_cache["val"], len(registration.extension.args)
+        )
         return ext
 
     return wrapper
@@ -177,37 +201,49 @@ def register_extension(
 
 extension_registry: Dict[str, Registration] = {}
 
+# Bumped on every registration so the cached views of the registry below are rebuilt.
+_registry_version = 0
+# Registrations split up by kind as they are registered, so the getters below don't scan the registry.
+_alias_registrations: Dict[str, Registration] = {}
+_function_registrations: Dict[str, Registration] = {}
+_class_registrations: Dict[str, Registration] = {}
+_registry_buckets = (
+    _alias_registrations,
+    _function_registrations,
+    _class_registrations,
+)
+# Greatest number of arguments taken by any registered extension, kept up to date on registration.
+_max_args_cache = {"val": 0}
+
 
-def get_alias_registrations():
+def get_alias_registrations() -> ValuesView[Registration]:
     """Get all registrations for extensions if they have are supposed to have a zsrhc alias."""
-    return {
-        registration
-        for registration in extension_registry.values()
-        if registration.alias
-    }
+    return _alias_registrations.values()
 
 
-def get_function_registrations():
+def get_function_registrations() -> ValuesView[Registration]:
     """Retrieve the functions in the registry."""
-    return [
-        registration
-        for registration in extension_registry.values()
-        if registration.is_function
-    ]
+    return _function_registrations.values()
 
 
-def get_class_registrations():
+def get_class_registrations() -> ValuesView[Registration]:
     """Retrieve the classes in the registry."""
-    return [
-        registration
-        for registration in extension_registry.values()
-        if not registration.is_function
-    ]
+    return _class_registrations.values()
 
 
-def get_registrations() -> Set[Registration]:
+def get_registrations() -> ValuesView[Registration]:
     """Retrieve the registrations present in the extension registry."""
-    return set(extension_registry.values())
+    return extension_registry.values()
+
+
+def get_sorted_registrations() -> Tuple[Registration, ...]:
+    """Retrieve the registrations present in the extension registry sorted by name."""
+    return _get_sorted_registrations(_registry_version)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_sorted_registrations(registry_version: int) -> Tuple[Registration, ...]:
+    return tuple(sorted(extension_registry.values(), key=lambda x: x.name))
 
 
 def get_extension_template_directory(
@@ -219,21 +255,17 @@ def get_extension_template_directory(
     """
     if isinstance(ext, Registration):
         return os.path.join(
-            pathlib.Path(inspect.getfile(ext.extension.handle)).parent.parent.resolve(),
+            get_module_parent_directory(ext.extension.handle),
             "templates",
             ext.extension.name,
         )
     elif isinstance(ext, Extension):
         return os.path.join(
-            pathlib.Path(
-                inspect.getfile(inspect.getmodule(ext.handle))
-            ).parent.parent.resolve(),
+            get_module_parent_directory(ext.handle),
             "templates",
             ext.name,
         )
 
 
-def get_greatest_num_args_in_registrations():
-    return max(
-        len(registration.extension.args) for registration in extension_registry.values()
-    )
+def get_greatest_num_args_in_registrations() -> int:
+    return _max_args_cache["val"]
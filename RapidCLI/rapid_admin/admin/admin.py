@@ -1,8 +1,19 @@
 from rapidcli.extension_registrar import register_extension
-from rapidcli.extension import Extension
-import shutil
+from rapidcli.extension import Extension, get_module_parent_directory
 import os
 
+WRITE_BUFFER_SIZE = 1 << 16
+# Templates are stored with these suffixes so they aren't picked up as code or configs
+TEMPLATE_SUFFIXES = {".rpy": ".py", ".ryml": ".yml"}
+
+
+def get_rendered_file_path(template_file_path: str) -> str:
+    """Retrieve the path of the file rendered from the template, with its template suffix mapped."""
+    root, suffix = os.path.splitext(template_file_path)
+    if suffix in TEMPLATE_SUFFIXES:
+        return root + TEMPLATE_SUFFIXES[suffix]
+    return template_file_path
+
 
 @register_extension()
 class RapidAdmin(Extension):
@@ -16,6 +27,30 @@ class RapidAdmin(Extension):
     def create_cli(self, project_dir: str = "", project_name: str = ""):
         """Given the project path, create a cli project at the project path."""
         new_cli_project_path = os.path.join(os.sep, project_dir, project_name)
-        shutil.copytree(
-            self.get_rendered_extension_templates("rapidcli"), destination_dir
+        cli_template_dir = os.path.join(
+            get_module_parent_directory(self.handle),
+            "templates",
+            "rapidcli_cli_template",
         )
+        # The templates are already rendered in memory, write them out instead of copying a directory
+        rendered_files = [
+            (
+                os.path.join(
+                    new_cli_project_path,
+                    get_rendered_file_path(template_file_path.lstrip(os.sep)),
+                ),
+                rendered_text,
+            )
+            for template_file_path, rendered_text in self.get_rendered_extension_templates(
+                cli_template_dir
+            )
+        ]
+        # Each directory only needs to be created once, however many templates it holds
+        destination_dirs = {
+            os.path.dirname(destination) for destination, _ in rendered_files
+        }
+        for destination_dir in destination_dirs:
+            os.makedirs(destination_dir, exist_ok=True)
+        for destination, rendered_text in rendered_files:
+            with open(destination, "w", buffering=WRITE_BUFFER_SIZE) as f:
+                f.write(rendered_text)
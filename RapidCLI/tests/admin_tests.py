@@ -0,0 +1,32 @@
+import os
+import tempfile
+import unittest
+
+from rapidcli.config_registrar import Config
+from rapidcli.rapid_admin.admin.admin import RapidAdmin
+
+
+class TestRapidAdmin(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.rapid_admin = RapidAdmin()
+        self.rapid_admin.config = Config()
+        self.rapid_admin.config.set_var("project_name", "test_cli")
+        self.rapid_admin.config.set_var("project_description", "A test CLI.")
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def test_create_cli(self):
+        self.rapid_admin.create_cli(self.temp_dir.name, "test_cli")
+
+        project_path = os.path.join(self.temp_dir.name, "test_cli")
+        self.assertEqual(sorted(os.listdir(project_path)), ["cli.py", "cli_config.yml"])
+        with open(os.path.join(project_path, "cli.py")) as cli_file:
+            cli_text = cli_file.read()
+        self.assertIn("class Test_cli(CLI):", cli_text)
+        self.assertIn('"""A test CLI."""', cli_text)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2, buffer=True)
@@ -1,9 +1,16 @@
 import os
 import pathlib
+import tempfile
+import threading
 import unittest
+from unittest.mock import patch
 
 from rapidcli.app_loader import (
+    _load_pickled_cli_config,
+    _pickle_cli_config,
     create_cli_config_from_cli_from_data,
+    get_cli_config_fingerprint,
+    render_config_args,
 )
 from rapidcli.config_registrar import (
     CLIConfig,
@@ -101,6 +108,111 @@ class TestUtils(unittest.TestCase):
             NestedObjInListConfig,
         )
 
+    def test_render_config_args(self):
+        self.test_extension.config.set_var("org_canonical_name", "test_org")
+        rendered_config = render_config_args(self.test_extension.config)
+
+        self.assertEqual(
+            rendered_config.searches[0].source_file,
+            "configs/bots/test_org/vars/data_vars.mwyml",
+        )
+        self.assertEqual(type(rendered_config), TestExtensionConfig)
+        self.assertEqual(type(rendered_config.searches[0]), SearchConfig)
+        self.assertEqual(rendered_config.static_var, "static_var_test")
+
+    def test_render_config_args_leaves_loaded_data_unchanged(self):
+        config_data = {
+            "paths": ["configs/{{org_canonical_name}}/a"],
+            "vars": {"path": "configs/{{org_canonical_name}}/b"},
+        }
+        config = CLIConfig()
+        config.set_var("org_canonical_name", "test_org")
+        config.set_var("paths", config_data["paths"])
+        config.set_var("vars", config_data["vars"])
+        rendered_config = render_config_args(config)
+
+        self.assertEqual(rendered_config.paths, ["configs/test_org/a"])
+        self.assertEqual(rendered_config.vars, {"path": "configs/test_org/b"})
+        self.assertEqual(
+            config_data,
+            {
+                "paths": ["configs/{{org_canonical_name}}/a"],
+                "vars": {"path": "configs/{{org_canonical_name}}/b"},
+            },
+        )
+
+    def test_show_input_menu(self):
+        self.test_extension.config = self.cli_config
+        self.test_extension.render_config_args()
+        with patch("builtins.input", return_value="1"), patch("builtins.print"):
+            self.test_extension.show_input_menu("test_extension")
+
+        self.assertEqual(self.test_extension.config.var, "1")
+        self.assertEqual(self.test_extension.config.choice_var, "yolo")
+        self.assertNotIn("_version", list(self.test_extension.config.keys()))
+
+
+class TestCLIConfigCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.apps_dir = self.temp_dir.name
+        self.app_config_path = os.path.join(self.apps_dir, "app", "app_config.yml")
+        os.makedirs(os.path.dirname(self.app_config_path))
+        for path in (
+            os.path.join(self.apps_dir, "cli_config.yml"),
+            self.app_config_path,
+        ):
+            with open(path, "w") as file:
+                file.write("apps: []\n")
+        self.cli_data = {"apps": ["app"]}
+        self.cache_path = os.path.join(self.apps_dir, "cli_config.pkl")
+        self.cli_config = CLIConfig()
+        self.cli_config.set_var("static_var", "static_var_test")
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def test_cache_hit(self):
+        fingerprint = get_cli_config_fingerprint(self.cli_data, self.apps_dir)
+        _pickle_cli_config(self.cli_config, self.cache_path, fingerprint)
+
+        cli_config = _load_pickled_cli_config(self.cache_path, fingerprint)
+        self.assertEqual(type(cli_config), CLIConfig)
+        self.assertEqual(cli_config.static_var, "static_var_test")
+        self.assertEqual(os.listdir(self.apps_dir).count("cli_config.pkl"), 1)
+
+    def test_cache_miss(self):
+        fingerprint = get_cli_config_fingerprint(self.cli_data, self.apps_dir)
+        self.assertIsNone(_load_pickled_cli_config(self.cache_path, fingerprint))
+        self.assertIsNone(_load_pickled_cli_config(None, fingerprint))
+
+    def test_cache_invalidated_on_config_change(self):
+        fingerprint = get_cli_config_fingerprint(self.cli_data, self.apps_dir)
+        _pickle_cli_config(self.cli_config, self.cache_path, fingerprint)
+
+        stat = os.stat(self.app_config_path)
+        os.utime(
+            self.app_config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9)
+        )
+        new_fingerprint = get_cli_config_fingerprint(self.cli_data, self.apps_dir)
+
+        self.assertNotEqual(fingerprint, new_fingerprint)
+        self.assertIsNone(_load_pickled_cli_config(self.cache_path, new_fingerprint))
+
+    def test_unpicklable_config_leaves_no_cache_file(self):
+        self.cli_config.set_var("lock", threading.Lock())
+        fingerprint = get_cli_config_fingerprint(self.cli_data, self.apps_dir)
+        _pickle_cli_config(self.cli_config, self.cache_path, fingerprint)
+
+        self.assertEqual(
+            [
+                name
+                for name in os.listdir(self.apps_dir)
+                if name.endswith((".pkl", ".tmp"))
+            ],
+            [],
+        )
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2, buffer=True)
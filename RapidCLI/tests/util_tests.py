@@ -1,5 +1,7 @@
+import json
 import os
 import shutil
+import tempfile
 import unittest
 from unittest.mock import patch
 
@@ -120,6 +122,26 @@ class TestUtils(unittest.TestCase):
     def test_make_singular(self):
         self.assertEqual(utils.make_singular("tables"), "table")
         self.assertEqual(utils.make_singular("countries"), "country")
+        self.assertEqual(utils.make_singular("branches"), "branch")
+        self.assertEqual(utils.make_singular("dishes"), "dish")
+
+    def test_write_json_file(self):
+        test_data = {
+            "name": "test_name",
+            "unicode": "caf\u00e9 \u2603",
+            "control": "tab\tnew\nline \x7f",
+            "numbers": [1, -2, 0.1, 1e16, 1e-07, 2**70, True, None],
+            "non_finite": [float("nan"), float("inf"), float("-inf")],
+            "nested": {"empty_list": [], "empty_dict": {}, "tuple": (1, "two")},
+            1: "int key",
+        }
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for data in (test_data, {"name": "test_name", "numbers": [1, 0.5]}):
+                path = os.path.join(temp_dir, "data.json")
+                utils.write_json_file(data, path)
+                with open(path) as file:
+                    self.assertEqual(file.read(), json.dumps(data, indent=2))
 
 
 if __name__ == "__main__":
@@ -1,12 +1,17 @@
 import csv
+import errno
+import functools
 import inspect
 import json
+import math
 import os
 import pathlib
 import re
-import string
+import shutil
 import subprocess
-from datetime import datetime
+import sys
+import weakref
+from datetime import date
 from typing import Any, Callable, Dict, Iterable, List, Sequence
 
 import git
@@ -14,20 +19,62 @@ import pandas as pd
 import yaml
 from colorama import Back, Fore
 from google.protobuf.descriptor import Descriptor
-from jinja2 import BaseLoader, Environment, FileSystemLoader
+from jinja2 import (
+    BaseLoader,
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+)
 
 import rapidcli.settings as settings
 
+# Prefer the libyaml backed loader and dumper, PyYAML falls back to pure python when it isn't built with it.
+try:
+    from yaml import CSafeDumper as YamlSafeDumper
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:
+    from yaml import SafeDumper as YamlSafeDumper
+    from yaml import SafeLoader as YamlSafeLoader
+
+CSV_CHUNK_SIZE = 50_000
+
+# orjson is optional, when it is installed json files with an indent of 2 are serialized by it.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class NoAliasDumper(YamlSafeDumper):
+    """Safe dumper that writes repeated objects out in full instead of as anchors and aliases."""
+
+    def ignore_aliases(self, data):
+        return True
+
+
 cache = {}
 
+# Quoted names in an AttributeError message, e.g. 'Config' object has no attribute 'name'
+_ATTR_RE = re.compile(r"'([^']*)'")
+# Uppercase letters that start a new word in camel or pascal case, other than the first letter
+_CAMEL_RE = re.compile(r"(?<!^)([A-Z])")
+# Turns proto enum names like SOME_VALUE in to friendly names like "some value" in one pass
+_UNDERSCORE_TO_SPACE_LOWER = str.maketrans(
+    "_ABCDEFGHIJKLMNOPQRSTUVWXYZ", " abcdefghijklmnopqrstuvwxyz"
+)
+
+# Resolved paths of the files defining each CLI class, the classes are weakly held
+_cli_path_cache = weakref.WeakKeyDictionary()
+_cli_parent_path_cache = weakref.WeakKeyDictionary()
+
 
 def find_files_by_extension_in_directory(path, file_extension):
-    files = []
-    for r, _, f in os.walk(path):
-        for file in f:
-            if str(file).endswith(file_extension):
-                files.append(os.path.join(r, file))
-    return files
+    """Find the files under the path ending with the extension, or any of a tuple of extensions."""
+    return [
+        file_path
+        for file_path in iterate_file_paths(path)
+        if file_path.endswith(file_extension)
+    ]
 
 
 def get_erroring_attr(attr_error: AttributeError):
@@ -39,24 +86,17 @@ def get_erroring_attr(attr_error: AttributeError):
 
 def parse_attr_error_message(attr_err_msg: str):
     """Parse and return the attribute that errored and the message of the erroe."""
-    parsed_msg = re.findall("'([^']*)'", attr_err_msg)
-    return parsed_msg
+    return _ATTR_RE.findall(attr_err_msg)
 
 
 def run_subprocess_from_root(*args):
-    """This temporarily changes the working directory to the root of the repo when runing a subpocess command."""
-    current_working_dir = os.getcwd()
-
-    # Temporarily change the dir to the repo where this file lives
-    os.chdir(get_repo_root())
-    subprocess.run(args)
-
-    # Change back to the working directory we were just at.
-    os.chdir(current_working_dir)
+    """Run the subprocess command from the root of the repo, the process' own working directory is left alone."""
+    subprocess.run(args, cwd=get_repo_root())
 
 
 def debug_print(msg):
-    cal_name = inspect.stack()[1][3]
+    # Only the caller's frame is needed, inspect.stack() would build info for the whole stack
+    cal_name = sys._getframe(1).f_code.co_name
     print(
         "\n".join(
             [f"Called from function {CLIColors.build_value_string(cal_name)}", str(msg)]
@@ -65,18 +105,43 @@ def debug_print(msg):
 
 
 def get_cli_path(cli: type):
-    return pathlib.Path(inspect.getfile(cli)).resolve()
+    cli_path = _cli_path_cache.get(cli)
+    if cli_path is None:
+        cli_path = pathlib.Path(inspect.getfile(cli)).resolve()
+        _cli_path_cache[cli] = cli_path
+    return cli_path
 
 
 def get_cli_parent_path(cli: type):
-    return str(pathlib.Path(inspect.getfile(cli)).parent.resolve())
+    cli_parent_path = _cli_parent_path_cache.get(cli)
+    if cli_parent_path is None:
+        cli_parent_path = str(pathlib.Path(inspect.getfile(cli)).parent.resolve())
+        _cli_parent_path_cache[cli] = cli_parent_path
+    return cli_parent_path
+
+
+def iterate_file_paths(directory: str):
+    """Yield the path of every file under the directory, recursively.
+
+    The DirEntry objects from os.scandir already know their type, so unlike os.walk no
+    extra stat is done per entry.  Like os.walk, unreadable directories are skipped and
+    symlinks to directories are neither followed nor yielded as files.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from iterate_file_paths(entry.path)
+                elif entry.is_file():
+                    yield entry.path
+    except OSError:
+        return
 
 
 def get_absolute_file_paths(directory):
     """Gets the absolute file paths of all files in a directory."""
-    for dirpath, _, filenames in os.walk(directory):
-        for f in filenames:
-            yield os.path.abspath(os.path.join(dirpath, f))
+    # Only the directory needs to be made absolute, the paths under it are joined onto it
+    yield from iterate_file_paths(os.path.abspath(directory))
 
 
 def write_content(content: Any, dest_path: str, export_data_type: str = None):
@@ -100,21 +165,15 @@ def write_content(content: Any, dest_path: str, export_data_type: str = None):
                 content.to_json(dest_path, index=False)
                 saved = True
             elif export_data_type == "csv":
-                content.to_csv(dest_path, index=False, quoting=csv.QUOTE_MINIMAL)
+                write_dataframe_to_csv(content, dest_path)
                 saved = True
             elif export_data_type == "xlsx":
                 content.to_excel(dest_path, index=False)
                 saved = True
 
-        elif isinstance(content, dict):
-            with open(dest_path, "w") as file:
-                json.dump(content, file, indent=2)
-                saved = True
-
-        elif isinstance(content, list):
-            with open(dest_path, "w") as file:
-                json.dump(content, file, indent=2)
-                saved = True
+        elif isinstance(content, (dict, list)):
+            write_json_file(content, dest_path, indent=2)
+            saved = True
 
     if saved:
         print_save_statement(dest_path)
@@ -123,7 +182,7 @@ def write_content(content: Any, dest_path: str, export_data_type: str = None):
 def load_yaml(filepath, encoding="utf-8"):
     """Loads a yml file."""
     with open(filepath, encoding=encoding) as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=YamlSafeLoader)
 
 
 def safe_mkdir(path):
@@ -150,50 +209,109 @@ def save_file(data: Any, path: str):
         file.write(data)
 
 
+def write_dataframe_to_csv(df: pd.DataFrame, dest_path: str):
+    """Write the DataFrame to a csv file without its index, in chunks of CSV_CHUNK_SIZE rows."""
+    df.to_csv(
+        dest_path, index=False, quoting=csv.QUOTE_MINIMAL, chunksize=CSV_CHUNK_SIZE
+    )
+
+
 def save_json_data(data: dict, path: str):
+    write_json_file(data, path, indent=4)
+
+
+def write_json_file(data: Any, path: str, indent: int = 2):
+    """Write the data to the path as json.
+
+    orjson only indents by 2, other indents and data orjson wouldn't write exactly like the
+    json module use the json module.
+    """
+    if orjson is not None and indent == 2 and _is_orjson_serializable(data):
+        try:
+            serialized = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            serialized = None
+        if serialized is not None:
+            pathlib.Path(path).write_bytes(serialized)
+            return
+
     with open(path, "w") as file:
-        json.dump(data, file, indent=4)
+        json.dump(data, file, indent=indent)
 
 
-def get_repo_root():
-    """Gets the root of the repo by changing working directory."""
-    cache_key = "get_repo_root"
+def _is_orjson_serializable(data: Any) -> bool:
+    """Check if orjson writes the data exactly like json.dump does.
 
-    if cache.get(cache_key):
-        return cache[cache_key]
+    orjson writes NaN and Infinity as null, doesn't escape non-ASCII characters and formats
+    exponents differently, so data holding them, or any other type than str keyed dicts,
+    lists, tuples, str, int, float, bool and None, is left to the json module.
+    """
+    seen_containers = set()
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        value_type = type(value)
+        if value_type is str:
+            # Printable ASCII is the only text both escape the same way
+            if not (value.isascii() and value.isprintable()):
+                return False
+        elif value_type is float:
+            if not math.isfinite(value) or "e" in repr(value):
+                return False
+        elif value_type in (dict, list, tuple):
+            if id(value) in seen_containers:
+                continue
+            seen_containers.add(id(value))
+            if value_type is dict:
+                if any(type(key) is not str for key in value):
+                    return False
+                stack.extend(value.keys())
+                stack.extend(value.values())
+            else:
+                stack.extend(value)
+        elif value_type not in (int, bool, type(None)):
+            return False
+    return True
+
+
+def _repo_singleton() -> git.Repo:
+    """Retrieve the git repo that this file lives in, it is only opened once."""
+    cache_key = "_repo_singleton"
 
-    current_working_dir = os.getcwd()
+    if cache.get(cache_key) is None:
+        cache[cache_key] = git.Repo(
+            pathlib.Path(__file__).parent.resolve(),
+            search_parent_directories=True,
+            odbt=git.GitCmdObjectDB,
+        )
+    return cache[cache_key]
 
-    # Temporarily change the dir to the repo where this file lives
-    os.chdir(pathlib.Path(__file__).parent.resolve())
-    with subprocess.Popen(
-        ["git", "rev-parse", "--show-toplevel"],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        stdin=subprocess.PIPE,
-    ) as process:
-        repo_root = process.stdout.read().decode("UTF-8").replace("\n", "")
-        process.kill()
-    # Change back to the working directory we were just at.
-    os.chdir(current_working_dir)
-    cache["get_repo_root"] = repo_root
 
-    return repo_root
+def get_repo_root():
+    """Gets the root of the repo that this file lives in, empty if it is not in a git repo."""
+    try:
+        return _repo_singleton().working_tree_dir
+    except (git.InvalidGitRepositoryError, git.NoSuchPathError):
+        return ""
 
 
 def get_local_login_username():
     """Gets the currently logged in username."""
-    with subprocess.Popen(
-        ["whoami"],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        stdin=subprocess.PIPE,
-    ) as process:
-        user_name = process.stdout.read().decode("UTF-8").replace("\n", "")
-        process.kill()
-        return user_name
+    cache_key = "get_local_login_username"
+
+    if cache.get(cache_key):
+        return cache[cache_key]
+
+    process = subprocess.run(
+        ["whoami"], capture_output=True, encoding="UTF-8", check=False
+    )
+    user_name = process.stdout.rstrip("\n")
+    cache[cache_key] = user_name
+
+    return user_name
 
 
+@functools.lru_cache(maxsize=1024)
 def change_to_snake_case(s: str):
     """Converts any casing to snake case, except uppercase will just be lowered."""
     if is_snake_case(s):
@@ -203,25 +321,12 @@ def change_to_snake_case(s: str):
     if s.isupper():
         return s.lower()
 
-    res = [s[0].lower()]
-    for c in s[1:]:
-        if c in string.ascii_uppercase:
-            res.append("_")
-            res.append(c.lower())
-        else:
-            res.append(c)
-
-    return "".join(res)
+    return _CAMEL_RE.sub(r"_\1", s).lower()
 
 
 def is_snake_case(s: str):
     """Checks if the given string is snake case."""
-    if any(c in ["-"] for c in s):
-        return False
-    for c in s:
-        if c.lower() != c:
-            return False
-    return True
+    return "-" not in s and s == s.lower()
 
 
 def select_choice_from_proto(
@@ -278,14 +383,9 @@ def get_enums_from_proto(
     Returns:
         List of tuples [(proto_enum, friendly_name)] without data in vals_to_remove
     """
-    if not vals_to_remove:
-        return [
-            (enum.name, enum.name.replace("_", " ").lower())
-            for enum in enum_descriptor_sequence
-        ]
-
+    vals_to_remove = frozenset(vals_to_remove) if vals_to_remove else frozenset()
     return [
-        (enum.name, enum.name.replace("_", " ").lower())
+        (enum.name, enum.name.translate(_UNDERSCORE_TO_SPACE_LOWER))
         for enum in enum_descriptor_sequence
         if enum.name not in vals_to_remove
     ]
@@ -301,25 +401,31 @@ def iterate_down_to(data: Dict, *args, **kwargs):
     is found in the nested dictionary then it will retrieve all of the values in the list
     for each nested dictionary.
     """
-    data_found = []
+    if not args:
+        return None
+
+    target = args[-1]
+    arg_set = frozenset(args)
+    var_to_key = kwargs.get("var_to_key")
 
     def find_recursively(data):
         if isinstance(data, dict):
             for field, value in data.items():
-                if field in args:
-                    find_recursively(value)
-                    if field == args[-1]:
-                        appended_item = value
-                        var_to_key = kwargs.get("var_to_key")
-                        if var_to_key and var_to_key in data:
-                            appended_item = {data[var_to_key]: value}
-                        data_found.append(appended_item)
-
-        if isinstance(data, list):
+                # Only the branches under one of the given keys can lead to the target
+                if field not in arg_set:
+                    continue
+                yield from find_recursively(value)
+                if field == target:
+                    if var_to_key and var_to_key in data:
+                        yield {data[var_to_key]: value}
+                    else:
+                        yield value
+
+        elif isinstance(data, list):
             for value in data:
-                find_recursively(value)
+                yield from find_recursively(value)
 
-    find_recursively(data)
+    data_found = list(find_recursively(data))
 
     if len(data_found) == 1:
         return data_found[0]
@@ -329,9 +435,10 @@ def iterate_down_to(data: Dict, *args, **kwargs):
 
 def get_last_commit_of_file(file_path):
     """Retrieve the last commit of a file that was not made by the logged in user."""
-    repo = git.Repo(get_repo_root(), odbt=git.GitCmdObjectDB)
+    repo = _repo_singleton()
+    local_login_username = get_local_login_username()
     for commit in repo.iter_commits(paths=file_path, max_count=20):
-        if get_local_login_username() not in repo.git.show("-s", commit.hexsha):
+        if local_login_username not in repo.git.show("-s", commit.hexsha):
             return commit
 
 
@@ -343,14 +450,19 @@ def git_restore_file(filepath: str, source=None):
     else:
         commands.append(filepath)
 
-    with subprocess.Popen(
-        commands,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        stdin=subprocess.PIPE,
-    ) as process:
-        process.communicate()
-        process.kill()
+    subprocess.run(commands, capture_output=True, check=False)
+
+
+def get_cache_path(*args, create_dir_if_not_found: bool = True):
+    """Retrieve an absolute path inside of the rapidcli cache directory, "~/.cache/rapidcli".
+
+    This is used like get_cache_path("cli_configs", "some_file.pkl"). Like get_export_path,
+    the last variable is assumed to be the file to save data to and is not created.
+    """
+    path = os.path.join(os.path.expanduser("~/.cache/rapidcli"), *args)
+    if create_dir_if_not_found:
+        safe_mkdir(os.path.dirname(path))
+    return path
 
 
 def get_export_path(ext_name, *args, create_dir_if_not_found: bool = True):
@@ -397,19 +509,92 @@ def render_template(
     render_args: dict, template_path: str, extension_root_template_dir: str
 ):
     """Retrieve the rendered Jinja template using the given render arguments."""
-    templateLoader = FileSystemLoader(extension_root_template_dir)
-    env = Environment(loader=templateLoader, trim_blocks=True, lstrip_blocks=True)
+    env = get_template_environment(extension_root_template_dir)
+    template = env.get_template(template_path)
+    return f"{template.render(**render_args)}\n"
+
 
-    for filter_key, jinja_filter in _get_filters().items():
-        env.filters[filter_key] = jinja_filter
+def render_template_to_file(
+    render_args: dict,
+    template_path: str,
+    extension_root_template_dir: str,
+    dest_path: str,
+):
+    """Render the Jinja template straight in to the destination file.
 
+    Same output as writing render_template's result, but the template is streamed to the
+    file so the whole rendered text is never held in memory.
+    """
+    env = get_template_environment(extension_root_template_dir)
     template = env.get_template(template_path)
-    return f"{template.render(**render_args)}\n"
+    with open(dest_path, "w") as file:
+        template.stream(**render_args).dump(file)
+        file.write("\n")
+
+
+class _BestEffortBytecodeCache(FileSystemBytecodeCache):
+    """Bytecode cache that never fails a render, templates are just compiled again on errors."""
+
+    def load_bytecode(self, bucket):
+        try:
+            super().load_bytecode(bucket)
+        except OSError:
+            pass
+
+    def dump_bytecode(self, bucket):
+        try:
+            super().dump_bytecode(bucket)
+        except OSError:
+            pass
+
+
+def get_template_environment(template_directory: str) -> Environment:
+    """Retrieve the process wide Jinja environment for the given template directory.
+
+    The environment keeps the templates it compiled in memory and their bytecode is
+    cached on disk in "~/.cache/rapidcli/jinja", so repeated renders skip compiling.
+    The bytecode cache is skipped if that directory can't be created or written to.
+    """
+    env = _template_environments.get(template_directory)
+    if env is None:
+        bytecode_cache_dir = get_cache_path("jinja", create_dir_if_not_found=False)
+        try:
+            safe_mkdir(bytecode_cache_dir)
+            bytecode_cache = _BestEffortBytecodeCache(bytecode_cache_dir)
+        except OSError:
+            bytecode_cache = None
+        env = Environment(
+            loader=FileSystemLoader(template_directory),
+            bytecode_cache=bytecode_cache,
+            trim_blocks=True,
+            lstrip_blocks=True,
+        )
+        for filter_key, jinja_filter in _get_filters().items():
+            env.filters[filter_key] = jinja_filter
+        _template_environments[template_directory] = env
+    return env
+
+
+_template_environments: Dict[str, Environment] = {}
 
 
 def render_string(string_to_render: str, render_args: Dict):
-    template = Environment(loader=BaseLoader()).from_string(string_to_render)
-    return template.render(**render_args, trim_blocks=True, lstrip_blocks=True)
+    # Every jinja delimiter starts with a "{", there is nothing to render without one.
+    if "{" not in string_to_render:
+        return string_to_render
+    template = _compile_string_template(string_to_render)
+    return template.render(**render_args)
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_string_template(string_to_render: str):
+    """Compile the jinja template once per unique string, rendering still takes a fresh context."""
+    return _string_template_env.from_string(string_to_render)
+
+
+_string_template_env = Environment(
+    loader=BaseLoader(), trim_blocks=True, lstrip_blocks=True
+)
 
 
 # TODO(bgarrard): Move this to the extension class
@@ -419,9 +604,7 @@ def _get_filters() -> Dict[str, Callable]:
 
 # TODO(bgarrard): Move this to the extension class
 def dict_to_yaml(data_dict: Dict):
-    noalias_dumper = yaml.dumper.SafeDumper
-    noalias_dumper.ignore_aliases = lambda self, data: True
-    return yaml.dump(data_dict, default_flow_style=False, Dumper=noalias_dumper)
+    return yaml.dump(data_dict, default_flow_style=False, Dumper=NoAliasDumper)
 
 
 def get_path_from_repo_root(*args):
@@ -432,24 +615,33 @@ def get_path_from_repo_root(*args):
 
         This produces "{repo_root}/first_dir/second_dir"
     """
-    return os.path.join(os.sep, *get_repo_root().split("/"), *args)
+    # The repo root is already absolute, os.sep only anchors the path when it is empty
+    return os.path.join(os.sep, get_repo_root(), *args)
 
 
 def backup_file(file_path):
     """This will back the given file in your /tmp folder."""
-    if os.path.exists(file_path):
-        file_name = os.path.basename(file_path)
-        new_file_name = f"{os.path.splitext(file_name)[0]}.bak"
-        temp_path = os.path.join(
-            os.sep, "tmp", f"{get_todays_date_string()}_{new_file_name}"
-        )
-        info_message = CLIColors.build_info_string(f"Backing up file:")
-        colored_file_path = CLIColors.build_location_string(file_path)
-        colored_temp_path = CLIColors.build_location_string(temp_path)
-        colored_message = f"{info_message} {colored_file_path} to {colored_temp_path}"
-        print(colored_message)
+    file_name = os.path.basename(file_path)
+    new_file_name = f"{os.path.splitext(file_name)[0]}.bak"
+    temp_path = os.path.join(
+        os.sep, "tmp", f"{get_todays_date_string()}_{new_file_name}"
+    )
+    # Moving the file is the existence check, a missing file has nothing to back up
+    try:
+        os.replace(file_path, temp_path)
+    except FileNotFoundError:
+        return
+    except OSError as err:
+        # /tmp is often on another filesystem, which a rename can't cross
+        if err.errno != errno.EXDEV:
+            raise
+        shutil.move(file_path, temp_path)
 
-        os.rename(file_path, temp_path)
+    info_message = CLIColors.build_info_string(f"Backing up file:")
+    colored_file_path = CLIColors.build_location_string(file_path)
+    colored_temp_path = CLIColors.build_location_string(temp_path)
+    colored_message = f"{info_message} {colored_file_path} to {colored_temp_path}"
+    print(colored_message)
 
 
 def provide_argument_help_string(given_arg: str, valid_args: List[str]) -> str:
@@ -468,7 +660,14 @@ def provide_argument_help_string(given_arg: str, valid_args: List[str]) -> str:
 
 
 def get_todays_date_string():
-    return datetime.today().strftime("%Y-%m-%d")
+    # Only formatted again once the date changes
+    cache_key = "get_todays_date_string"
+    today = date.today()
+
+    cached = cache.get(cache_key)
+    if cached is None or cached[0] != today:
+        cache[cache_key] = (today, today.strftime("%Y-%m-%d"))
+    return cache[cache_key][1]
 
 
 def transform_dict_list_to_dataframe(
@@ -497,31 +696,79 @@ def transform_dict_list_to_dataframe(
     |-----------------|
     |the_value_we_want|
     """
-    df_dict = {k: [] for k, _ in transform_map.items()}
-    for column, dict_walk_list in transform_map.items():
-        for data_dict in data_list:
-            value = iterate_down_to(data_dict, *dict_walk_list)
-            df_dict[column].append(value)
+    columns = list(transform_map)
+    # (column index, keys to walk through, key to retrieve) per column, as iterate_down_to uses them
+    column_walks = tuple(
+        (idx, frozenset(dict_walk_list), dict_walk_list[-1])
+        for idx, dict_walk_list in enumerate(transform_map.values())
+        if dict_walk_list
+    )
 
-    return pd.DataFrame.from_dict(df_dict)
+    num_rows = len(data_list)
+    df_dict = {column: [None] * num_rows for column in columns}
+    column_values = [df_dict[column] for column in columns]
+    for row, data_dict in enumerate(data_list):
+        # Each dict is walked once for all of the columns, shared keys are only descended once
+        data_found = [[] for _ in columns]
+        _find_column_values(data_dict, column_walks, data_found)
+        for values, column_data_found in zip(column_values, data_found):
+            if len(column_data_found) == 1:
+                values[row] = column_data_found[0]
+            elif column_data_found:
+                values[row] = column_data_found
+
+    return pd.DataFrame(df_dict, copy=False)
+
+
+def _find_column_values(data: Any, column_walks: Sequence, data_found: List[List]):
+    """Walk the data like iterate_down_to does, but for every column walk at the same time."""
+    if isinstance(data, dict):
+        for field, value in data.items():
+            active_walks = tuple(walk for walk in column_walks if field in walk[1])
+            if not active_walks:
+                continue
+            _find_column_values(value, active_walks, data_found)
+            for idx, _, target in active_walks:
+                if field == target:
+                    data_found[idx].append(value)
+
+    elif isinstance(data, list):
+        for value in data:
+            _find_column_values(value, column_walks, data_found)
 
 
 def is_plural(string: str):
     """Check if a string is plural or not."""
-    if string[-3:] == "ies":
-        return True
-    return string[-1] == "s"
+    # Words ending in "ies" end in "s" too
+    return string.endswith("s")
 
 
 def make_singular(string: str):
     """Returns a non plural version of given string."""
-    if string[-3:] == "ies":
+    if string.endswith("ies"):
         return f"{string[:-3]}y"
-    elif string[-2:] == "es" and string[-4:-2] == "ch":
-        return f"{string[:-2]}"
+    elif string.endswith(("ches", "shes")):
+        return string[:-2]
     return string[:-1]
 
 
+def _memoize_colored_string(builder: Callable) -> Callable:
+    """Cache the colored strings of a CLIColors builder, the same few strings get colored over and over.
+
+    Only str values are cached, anything else, e.g. numbers or lists from a config, is colored
+    without the cache since values that compare equal can still print differently.
+    """
+    cached_builder = functools.lru_cache(maxsize=512, typed=True)(builder)
+
+    @functools.wraps(builder)
+    def wrapper(string: Any, *args, **kwargs):
+        if type(string) is not str:
+            return builder(string, *args, **kwargs)
+        return cached_builder(string, *args, **kwargs)
+
+    return wrapper
+
+
 class CLIColors:
     """These are colors for the CLI framework itself."""
 
@@ -536,20 +783,26 @@ class CLIColors:
     def sanitize(string: str, color: str):
         if not string:
             return ""
-        else:
-            return str(string).replace(Fore.RESET, color)
+        string = str(string)
+        # Most strings aren't colored already, so there is no reset to swap out
+        if Fore.RESET not in string:
+            return string
+        return string.replace(Fore.RESET, color)
 
     @staticmethod
+    @_memoize_colored_string
     def build_info_string(string: str):
         string = CLIColors.sanitize(string, Fore.GREEN)
         return f"{Fore.GREEN}{string}{Fore.RESET}"
 
     @staticmethod
+    @_memoize_colored_string
     def build_error_string(string: str):
         string = CLIColors.sanitize(string, Fore.RED)
         return f"{Fore.RED}{string}{Fore.RESET}"
 
     @staticmethod
+    @_memoize_colored_string
     def build_location_string(string: str, unfollowable: bool = False):
         if unfollowable:
             return CLIColors._build_unfollowable_location_string(string)
@@ -558,16 +811,19 @@ class CLIColors:
         return f"{Fore.YELLOW}{string}{Fore.RESET}"
 
     @staticmethod
+    @_memoize_colored_string
     def build_value_string(string: str):
         string = CLIColors.sanitize(string, Fore.CYAN)
         return f"{Fore.CYAN}{string}{Fore.RESET}"
 
     @staticmethod
+    @_memoize_colored_string
     def build_neutral_string(string: str):
         string = CLIColors.sanitize(string, Fore.LIGHTGREEN_EX)
         return f"{Fore.LIGHTGREEN_EX}{string}{Fore.RESET}"
 
     @staticmethod
+    @_memoize_colored_string
     def build_doc_string(string: str):
         string = CLIColors.sanitize(string, Fore.MAGENTA)
         return f"{Fore.MAGENTA}{string}{Fore.RESET}"
@@ -577,6 +833,7 @@ class CLIColors:
         return list(map(getattr(cls, f"build_{text_type}_string"), args))
 
     @staticmethod
+    @_memoize_colored_string
     def _build_unfollowable_location_string(string: str):
         string = CLIColors.sanitize(string, Fore.LIGHTYELLOW_EX)
         string = f"{Fore.LIGHTYELLOW_EX}{string}{Fore.RESET}"